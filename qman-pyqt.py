@@ -24,14 +24,18 @@ authors:
 
 import sys
 import os
-from PySide6.QtWidgets import QApplication, QMainWindow, QInputDialog, QMessageBox, QVBoxLayout
+from PySide6.QtWidgets import QApplication, QMainWindow, QInputDialog, QMessageBox, QVBoxLayout, QProgressBar
 from widgets import qrow_widget, CurrentQueue, update_table, ObjectInfo, SkyView, SkyPlot, FinderChart
-from PySide6.QtCore import SIGNAL, Qt, QTimer, QRunnable, Slot, QThreadPool
+from PySide6.QtCore import Qt, QTimer, QRunnable, Slot, QThreadPool, QObject, Signal, QMutex, QMutexLocker, QEvent
 from ui_qman_pyqt import Ui_MainWindow
 import pandas as pd
 import numpy as np
 import json
-from datetime import datetime as dt
+import io
+import re
+import copy
+import bisect
+import time
 import logging
 import fcntl
 import argparse
@@ -39,12 +43,25 @@ from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as Navigatio
 import matplotlib.pyplot as plt
 
 # import asyncio
-# import time
 # import threading
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s %(message)s', filemode='w', filename='qman.log')
 # os.environ['QT_MAC_WANTS_LAYER'] = '1'    # to work on MacOS
 
+QUEUE_COLUMNS = ['Object', 'Number', 'Type', 'Filter', 'Exposure', 'ROT']
+FILTER_NAMES = {'Han': 'Ha narrow', 'Haw': 'Ha wide'}  # short filter names used in GUI -> CCDOBS names
+CATEGORY_COLUMNS = ['Object', 'Type', 'Filter', 'ROT']  # repeated string columns stored as pandas categoricals
+
+class WorkerSignals(QObject):
+    '''
+    Signals available from a running worker thread.
+
+    result: object returned by the callback
+    error: exception raised by the callback
+    '''
+    result = Signal(object)
+    error = Signal(object)
+
 class Worker(QRunnable):
     '''
     Worker thread
@@ -63,13 +80,20 @@ class Worker(QRunnable):
         self.fn = fn
         self.args = args
         self.kwargs = kwargs
+        self.signals = WorkerSignals()
 
     @Slot()
     def run(self):
         '''
         Initialise the runner function with passed args, kwargs.
         '''
-        self.fn(*self.args, **self.kwargs)
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            logging.error(f'func: {self.fn.__name__}() Error: {e}')
+            self.signals.error.emit(e)
+        else:
+            self.signals.result.emit(result)
 
 class SingleInstance:
     def __init__(self, lockfile):
@@ -93,11 +117,18 @@ class QmanMain(QMainWindow):
         self.ui = Ui_MainWindow()
         self.ui.setupUi(self)
         self.thread_pool = QThreadPool()  # Initialize QThreadPool
+        self.rtcoor_mutex = QMutex()  # Only one worker computes and writes rtcoor.data at a time
+        self._rtcoor_id = 0  # id of the latest json_dump request
+        self._rtcoor_written = 0  # id of the dump in rtcoor.data, older dumps are not written (guarded by rtcoor_mutex)
+        self._rtcoor_shown = 0  # id of the dump shown in HA/Alt
         logging.info(f'QThreadPool maxThreadCount: {self.thread_pool.maxThreadCount()}')
         self.ccdobs = cargs.ccdobs
-        self.qobjs = self.get_qlist()
+        self.load_queues()
         self.qrows = []
+        self.spare_qrows = []  # hidden qrow_widgets kept for reuse
         self.my_obj = ObjectInfo(objname='dummy', objpos=pd.DataFrame(), debug=cargs.debug)
+        self._resolve_id = 0  # id of the latest object resolve request, older results are dropped
+        self._resolving = False
         self.debug = cargs.debug
         if self.debug:
             logging.getLogger().setLevel(logging.DEBUG)
@@ -105,11 +136,20 @@ class QmanMain(QMainWindow):
         logging.info(f'CCDOBS file: {self.ccdobs}')
 
 
+        # Busy indicator shown in statusbar while object is being resolved
+        self.busy = QProgressBar()
+        self.busy.setRange(0, 0)
+        self.busy.setMaximumWidth(100)
+        self.busy.hide()
+        self.ui.statusbar.addPermanentWidget(self.busy)
+
         # SkyView, SkyPlot, FinderChart instances
         self.skyview = SkyView(self.ui)
         self.skyplot = SkyPlot(self.ui.skyplot, self.my_obj, self.ui)
+        self._plotted_obj, self._plotted_bucket = self.my_obj, int(time.time() // 60)  # what skyplot currently shows
         self.fchart = FinderChart(self.ui.fchart)
         
+        self._toolbars = {}  # canvas -> NavigationToolbar, created on first use
         for widget, ui in [(self.skyplot, self.ui.skyplot), (self.fchart, self.ui.fchart)]:
             layout = ui.layout()
             if layout is None:
@@ -119,9 +159,7 @@ class QmanMain(QMainWindow):
                 layout.setAlignment(Qt.AlignCenter)  # Center alignment for layout
                 ui.setLayout(layout)
             layout.addWidget(widget.canvas)
-        # Add Matplotlib navigation toolbar for zooming and panning
-        self.toolbar = NavigationToolbar(widget.canvas, self, coordinates=False)
-        layout.addWidget(self.toolbar)
+            widget.canvas.installEventFilter(self)  # toolbar is added on first hover/focus, see eventFilter
 
         # Read objpos.dat file
         self.objpos = pd.DataFrame(columns=['Object', 'RAd', 'RAm', 'RAs', 
@@ -135,13 +173,17 @@ class QmanMain(QMainWindow):
                                     comment='#', skipinitialspace=True)
         except (FileNotFoundError, ValueError) as e:
             logging.warning(f'Warning: No objpos file found!')
-            self.ui.statusbar.showMessage(f'{dt.now().strftime("%H:%M:%S")} Warning: No objpos file found!')
+            self.ui.statusbar.showMessage(f'{self._now()} Warning: No objpos file found!')
 
-        # Fill QListWidget with objects
-        for obj in sorted(self.qobjs['Object'].unique(), key=str.lower):
-            self.ui.qobjs.addItem(obj)
+        # Coalesce rtcoor.data writes: dump only after my_obj changes or on the skyplot tick
+        self.json_timer = QTimer(self)
+        self.json_timer.setSingleShot(True)
+        self.json_timer.timeout.connect(self.json_dump)
+
+        # Fill QListWidget with objects (filtering only hides rows)
+        self.fill_qobjs_list()
         # Connect QListWidget click to function
-        self.ui.qobjs.connect(self.ui.qobjs, SIGNAL("itemClicked(QListWidgetItem *)"), self.on_qlist_item_clicked)
+        self.ui.qobjs.itemClicked.connect(self.on_qlist_item_clicked)
         # Set first object as current at startup
         self.ui.qobjs.setCurrentItem(self.ui.qobjs.item(0))
         self.on_qlist_item_clicked(self.ui.qobjs.item(0))
@@ -159,30 +201,60 @@ class QmanMain(QMainWindow):
         self.ui.actionRemove_queue.triggered.connect(self.remove_queue)
         # Connect Change Name button to function
         self.ui.actionChange_name.triggered.connect(self.change_name)
+        # Connect Reload queues (F5) to function
+        self.ui.actionReload_queues.triggered.connect(self.reload_from_disk)
         # Connect Resolve button to function
-        self.ui.resolve.clicked.connect(self.get_obj_data)
-        # Connect Filter inpout to function on text change
+        self.ui.resolve.clicked.connect(lambda: self.get_obj_data())
+        # Connect Filter inpout to function on text change (debounced, so fast typing filters once)
+        self.filter_timer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.timeout.connect(self.do_filter_qobjs)
         self.ui.qobjs_filter.textChanged.connect(self.filter_qobjs)
 
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.json_dump)
-        self.timer.start(1000) 
-
         self.skyplot_timer = QTimer(self)
         self.skyplot_timer.timeout.connect(self.run_replot_skyplot)
         self.skyplot_timer.start(10000)
 
-        self.ui.statusbar.showMessage(f'{dt.now().strftime("%H:%M:%S")} Ready!')
+        self.ui.statusbar.showMessage(f'{self._now()} Ready!')
         logging.info(f'Ready!')
 
 
+    def eventFilter(self, obj, event):
+        # Add Matplotlib navigation toolbar for zooming and panning when plot is used for the first time
+        if event.type() in (QEvent.Enter, QEvent.FocusIn) and obj not in self._toolbars:
+            self._toolbars[obj] = NavigationToolbar(obj, self, coordinates=False)
+            obj.parentWidget().layout().addWidget(self._toolbars[obj])
+            obj.removeEventFilter(self)
+        return super().eventFilter(obj, event)
+
+    def _now(self):
+        # HH:MM:SS timestamp for statusbar messages (cheaper than datetime.strftime)
+        t = time.localtime()
+        return f'{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}'
+
+    @property
+    def qobjs(self):
+        # All queues as one DataFrame, concatenated only when queues changed since last access
+        if self._qobjs is None:
+            frames = list(self._queue_frames.values())
+            qobjs = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+            # Empty queues (CurrentQueue without rows) have no columns
+            self._qobjs = self.categorize_queue(qobjs.reindex(columns=QUEUE_COLUMNS))
+        return self._qobjs
+
+    def load_queues(self):
+        # Read CCDOBS file into per-object queues
+        qobjs = self.get_qlist()
+        self._queue_frames = {obj: queue for obj, queue in qobjs.groupby('Object', sort=False, observed=True)}
+        self._qobjs = qobjs
+
     @Slot()
     def generate_fchart(self):
         # Create a FinderChartWorker with the user inputs
         worker = Worker(self.fchart.plot, self.my_obj.ra, self.my_obj.dec, self.my_obj.normed_objname)
         # Execute the worker using QThreadPool
         self.thread_pool.start(worker)
-        self.ui.statusbar.showMessage(f'{dt.now().strftime("%H:%M:%S")} Generating finder chart...')
+        self.ui.statusbar.showMessage(f'{self._now()} Generating finder chart...')
         logging.info(f'Finder chart generated!')
     
     # @Slot()
@@ -191,94 +263,142 @@ class QmanMain(QMainWindow):
     #     self.thread_pool.start(worker)
 
     # @Slot()
-    def run_replot_skyplot(self):
+    def run_replot_skyplot(self, force=False):
+        self.request_json_dump()  # refresh HA/Alt every skyplot tick
+        # Redraw only for a new object or once per minute (Sun/Moon/object move slowly)
+        time_bucket = int(time.time() // 60)
+        if not force and self.my_obj is self._plotted_obj and time_bucket == self._plotted_bucket:
+            return
+        self._plotted_obj, self._plotted_bucket = self.my_obj, time_bucket
         self.skyplot.my_obj = self.my_obj
+        # Stays on GUI thread: SkyPlot.on_click and canvas resizes redraw the same figure here,
+        # and matplotlib figures are not thread-safe. The astropy work is done inside astroplan's
+        # plot_sky while it adds artists, so it cannot be split off without reimplementing plot_sky.
         # worker = Worker(self.skyplot.replot)
         # self.thread_pool.start(worker)
         self.skyplot.replot()
 
+    def request_json_dump(self):
+        # Restart single-shot timer, so bursts of changes end up in one json_dump
+        self.json_timer.start(100)
+
     def set_queue(self):
-        self.qobjs = self.get_qlist()
         curr_q = CurrentQueue(self.qrows, '0_CURRENT_QUEUE')
-        # Set current queue as 0_CURRENT_QUEUE
-        self.qobjs = self.qobjs[self.qobjs['Object'] != '0_CURRENT_QUEUE'] # remove all 0_CURRENT_QUEUEs from list
-        self.qobjs = pd.concat([curr_q.queue, self.qobjs]) # add current queue to list
+        # Set current queue as 0_CURRENT_QUEUE (replaces the old one, kept first)
+        self._queue_frames.pop('0_CURRENT_QUEUE', None)
+        self._queue_frames = {'0_CURRENT_QUEUE': curr_q.queue, **self._queue_frames}
+        self._qobjs = None
         self.save_queue()
-        self.ui.statusbar.showMessage(f'{dt.now().strftime("%H:%M:%S")} Queue set!')
+        self.ui.statusbar.showMessage(f'{self._now()} Queue set!')
         logging.info(f'Queue set!')
 
-    @update_table
+    @Slot()
     def json_dump(self):
-        rtcoor_path = '/dev/shm/rtcoor.data' if os.path.exists('/dev/shm') else 'rtcoor.data'
+        if self._resolving:
+            return  # rtcoor.data is written again once the new object is resolved
+        # Worker gets a copy of current object: get_info() updates ra/dec/ha/alt/az, which GUI thread reads
+        self._rtcoor_id += 1
+        worker = Worker(self.compute_and_write_rtcoor, self._rtcoor_id, self.my_obj, copy.copy(self.my_obj),
+                        self.table_data['Object'].values[0])
+        worker.signals.result.connect(self.update_ha_alt)
+        worker.signals.error.connect(self.on_json_dump_error)
+        self.thread_pool.start(worker)
+
+    def compute_rtcoor(self, my_obj, objname):
+        obj_alt, obj_az, obj_ha_sex, ra, dec_sex = my_obj.get_info()
         try:
-            with open(rtcoor_path, 'w') as f:
-                obj_alt, obj_az, obj_ha_sex, ra, dec_sex = self.my_obj.get_info()
-                try:
-                    json.dump({'ra': np.round(self.my_obj.ra, 5), 
-                            'dec': np.round(self.my_obj.dec, 5),
-                            'dec_sex': dec_sex.split()[0],
-                            'ha': np.round(self.my_obj.ha, 5),
-                            'ha_sex': obj_ha_sex,
-                            'alt': np.round(self.my_obj.alt, 1), 
-                            'az': np.round(self.my_obj.az, 1), 
-                            'objname': self.table_data['Object'].values[0]},
-                            f)
-                except TypeError as e:
-                    # logging.error(f'Error: {e}')
-                    json.dump({'-': '-', '-': '-', '-': '-', '-': '-', '-': '-', '-': '-', '-': '-'}, f)
-                    # self.ui.statusbar.showMessage(f'{dt.now().strftime("%H:%M:%S")} Error: {e}')
-            self.table_data['HA'] = f'{obj_ha_sex}'
-            self.table_data['Alt'] = f'{obj_alt}'
-        except Exception as e:
-            logging.error(f'func: json_dump() Error: {e}')
-            self.ui.statusbar.showMessage(f'{dt.now().strftime("%H:%M:%S")} Error: {e}')
+            rtcoor = {'ra': np.round(my_obj.ra, 5), 
+                    'dec': np.round(my_obj.dec, 5),
+                    'dec_sex': dec_sex.split()[0],
+                    'ha': np.round(my_obj.ha, 5),
+                    'ha_sex': obj_ha_sex,
+                    'alt': np.round(my_obj.alt, 1), 
+                    'az': np.round(my_obj.az, 1), 
+                    'objname': objname}
+        except TypeError as e:
+            # logging.error(f'Error: {e}')
+            rtcoor = {'-': '-', '-': '-', '-': '-', '-': '-', '-': '-', '-': '-', '-': '-'}
+        return rtcoor, obj_ha_sex, obj_alt
+
+    def write_rtcoor(self, rtcoor):
+        rtcoor_path = '/dev/shm/rtcoor.data' if os.path.exists('/dev/shm') else 'rtcoor.data'
+        with open(rtcoor_path, 'w') as f:
+            json.dump(rtcoor, f)
+
+    def compute_and_write_rtcoor(self, rtcoor_id, source_obj, my_obj, objname):
+        # Runs in worker thread - no GUI calls here
+        with QMutexLocker(self.rtcoor_mutex):
+            if rtcoor_id < self._rtcoor_written:
+                return None # newer dump already written
+            rtcoor, obj_ha_sex, obj_alt = self.compute_rtcoor(my_obj, objname)
+            self.write_rtcoor(rtcoor)
+            self._rtcoor_written = rtcoor_id
+        return rtcoor_id, source_obj, obj_ha_sex, obj_alt
+
+    @Slot(object)
+    @update_table
+    def update_ha_alt(self, result):
+        if result is None:
+            return self
+        rtcoor_id, source_obj, obj_ha_sex, obj_alt = result
+        if source_obj is not self.my_obj or rtcoor_id < self._rtcoor_shown:
+            return self # values of previous object or older dump
+        self._rtcoor_shown = rtcoor_id
+        self.table_data['HA'] = f'{obj_ha_sex}'
+        self.table_data['Alt'] = f'{obj_alt}'
         return self
+
+    @Slot(object)
+    def on_json_dump_error(self, e):
+        self.ui.statusbar.showMessage(f'{self._now()} Error: {e}')
     
     def save_queue(self):
         # Save all queues to file
-        self.current_queue = self.qobjs[self.qobjs['Object'] == '0_CURRENT_QUEUE']
+        # Translate filter names once for all queues (renames categories, not rows)
+        qobjs = self.qobjs.assign(Filter=self.qobjs['Filter'].cat.rename_categories(lambda filt: FILTER_NAMES.get(filt, filt)))
+        self.current_queue = qobjs[qobjs['Object'] == '0_CURRENT_QUEUE']
+        # Build whole file content in memory and write it at once
+        parts = [self.format_queue(self.current_queue), '\n']
+        all_queues = qobjs[qobjs['Object'] != '0_CURRENT_QUEUE']
+        for obj, obj_queue in all_queues.groupby('Object', sort=False, observed=True):
+            parts.extend((f"% {obj}\n", self.format_queue(obj_queue), '\n'))
         with open(self.ccdobs, 'w') as f:
-            for n, row in self.current_queue.iterrows():
-                row['Filter'] = 'Ha narrow' if row['Filter'] == 'Han' else row['Filter']
-                row['Filter'] = 'Ha wide' if row['Filter'] == 'Haw' else row['Filter']
-                f.write(f"{row['Number']:^5d}{row['Type']:<7s}{row['Filter']:<11s}{row['Exposure']:<7.1f}{row['ROT']:<2s}\n")
-            f.write('\n')
-
-            all_queues = self.qobjs[self.qobjs['Object'] != '0_CURRENT_QUEUE']
-            for obj in all_queues['Object'].unique():
-                obj_queue = all_queues[all_queues['Object'] == obj]
-                f.write(f"% {obj}\n")
-                for n, row in obj_queue.iterrows():
-                    row['Filter'] = 'Ha narrow' if row['Filter'] == 'Han' else row['Filter']
-                    row['Filter'] = 'Ha wide' if row['Filter'] == 'Haw' else row['Filter']
-                    f.write(f"{row['Number']:^5d}{row['Type']:<7s}{row['Filter']:<11s}{row['Exposure']:<7.1f}{row['ROT']:<2s}\n")
-                f.write('\n')
+            f.write(''.join(parts))
+
+    def format_queue(self, queue):
+        # Format queue rows as CCDOBS lines (column-wise, without iterrows)
+        rows = zip(queue['Number'].to_numpy(), queue['Type'].to_numpy(), queue['Filter'].to_numpy(),
+                   queue['Exposure'].to_numpy(), queue['ROT'].to_numpy())
+        return ''.join(f"{number:^5d}{imtype:<7s}{filt:<11s}{exptime:<7.1f}{rot:<2s}\n" for number, imtype, filt, exptime, rot in rows)
     
     def remove_queue(self):
         # show dialog with name input
-        self.qobjs = self.get_qlist()
         name = self.ui.qobjs.currentItem().text()
-        self.qobjs = self.qobjs[self.qobjs['Object'] != name]
+        self._queue_frames.pop(name, None)
+        self._qobjs = None
+        self.remove_obj_name(name)
         self.save_queue()
-        self.ui.qobjs.takeItem(self.ui.qobjs.currentRow())
         self.ui.qobjs.setCurrentItem(self.ui.qobjs.item(0))
         self.on_qlist_item_clicked(self.ui.qobjs.item(0))
-        self.ui.statusbar.showMessage(f'{dt.now().strftime("%H:%M:%S")} Queue for {name} removed!')
+        self.ui.statusbar.showMessage(f'{self._now()} Queue for {name} removed!')
         logging.info(f'Queue for {name} removed!')
 
     def add_queue(self):
         # show dialog with name input
-        self.qobjs = self.get_qlist()
         text, ok = QInputDialog.getText(self, 'Add queue', 'Object name:')
         if ok:
-            self.ui.qobjs.addItem(text)
             toadd = CurrentQueue(self.qrows, text).queue
-            self.qobjs = pd.concat([toadd, self.qobjs])
+            if text in self._queue_frames:
+                # Existing queue is kept, new rows go first (as before per-object frames)
+                self._queue_frames[text] = pd.concat([toadd, self._queue_frames[text]])
+            else:
+                self._queue_frames[text] = toadd
+            self._qobjs = None
+            row = self._obj_names.index(text) if text in self._obj_names else self.insert_obj_name(text)
             self.save_queue()
-            self.ui.qobjs.sortItems()
-            self.ui.qobjs.setCurrentItem(self.ui.qobjs.findItems(text, Qt.MatchExactly)[0])
+            self.ui.qobjs.setCurrentRow(row)
             self.on_qlist_item_clicked(self.ui.qobjs.currentItem())
-            self.ui.statusbar.showMessage(f'{dt.now().strftime("%H:%M:%S")} Queue for {text} added!')
+            self.ui.statusbar.showMessage(f'{self._now()} Queue for {text} added!')
             logging.info(f'Queue for {text} added!')
     
     def change_name(self):
@@ -286,66 +406,96 @@ class QmanMain(QMainWindow):
         text, ok = QInputDialog.getText(self, 'Change name', 'Object name:')
         if ok:
             old_name = self.ui.qobjs.currentItem().text()
-            self.ui.qobjs.currentItem().setText(text)
-            self.ui.qobjs.setCurrentItem(self.ui.qobjs.findItems(text, Qt.MatchExactly)[0])
-            self.qobjs = self.qobjs.replace(old_name, text)
+            self.remove_obj_name(old_name)
+            # Renaming onto an existing object merges the queues, so keep its single list row
+            row = self._obj_names.index(text) if text in self._obj_names else self.insert_obj_name(text)
+            self.ui.qobjs.setCurrentRow(row)
+            frames = {}
+            for obj, queue in self._queue_frames.items():
+                if obj == old_name:
+                    obj, queue = text, queue.assign(Object=text)
+                frames[obj] = pd.concat([frames[obj], queue]) if obj in frames else queue
+            self._queue_frames = frames
+            self._qobjs = None
             self.on_qlist_item_clicked(self.ui.qobjs.currentItem())
             self.save_queue()
-            self.ui.qobjs.sortItems()
-            self.ui.statusbar.showMessage(f'{dt.now().strftime("%H:%M:%S")} Name changed to {text}!')
+            self.ui.statusbar.showMessage(f'{self._now()} Name changed to {text}!')
             logging.info(f'Name changed to {text}!')
     
     @update_table
     def add_row(self):
         # Add row to queue
         empty_row = {'Object': 'Foo', 'Number': 1, 'Type': 'Image', 'Filter': 'None', 'Exposure': 1.0, 'ROT': '16'}
-        new_qrow = qrow_widget(empty_row, self.qrows, self)
+        if self.spare_qrows:
+            new_qrow = self.spare_qrows.pop(0)
+            new_qrow.update_from(empty_row)
+            new_qrow.setVisible(True)
+        else:
+            new_qrow = qrow_widget(empty_row, self.qrows, self)
+            self.ui.queue.layout().addWidget(new_qrow)
         self.qrows.append(new_qrow)
-        self.ui.queue.layout().addWidget(new_qrow)
         qtime = CurrentQueue(self.qrows, 'dummy').countQueue()
         self.table_data['Queue time'] = str(qtime)
-        self.ui.statusbar.showMessage(f'{dt.now().strftime("%H:%M:%S")} Row added!')
+        self.ui.statusbar.showMessage(f'{self._now()} Row added!')
         logging.info(f'Row added!')
         return self
 
     def on_qlist_item_clicked(self, item):
-        clicked_queue = self.qobjs[self.qobjs['Object'] == item.text()]
+        clicked_queue = self._queue_frames.get(item.text(), pd.DataFrame(columns=QUEUE_COLUMNS))
         self.ui.obj_name.setText(item.text())
-        for wid in self.qrows:
-            wid.deleteLater()
+        # Reuse existing row widgets (in layout order), create only missing ones and hide the rest
+        pool = self.qrows + self.spare_qrows
         self.qrows = []
-        for n, row in clicked_queue.iterrows():
-            new_qrow = qrow_widget(row, self.qrows, self)
+        for n, row in enumerate(clicked_queue.to_dict('records')):
+            if n < len(pool):
+                new_qrow = pool[n]
+                new_qrow.update_from(row)
+                new_qrow.setVisible(True)
+            else:
+                new_qrow = qrow_widget(row, self.qrows, self)
+                self.ui.queue.layout().addWidget(new_qrow)
             self.qrows.append(new_qrow)
-            self.ui.queue.layout().addWidget(new_qrow)
-        self.get_obj_data()
-        self.generate_fchart()
-        self.skyview.create_aladin_view(self.my_obj.c.ra.deg, self.my_obj.c.dec.deg) # create new Aladin view
-        self.ui.statusbar.showMessage(f'{dt.now().strftime("%H:%M:%S")} Queue for {item.text()} loaded!')
+        self.spare_qrows = pool[len(self.qrows):]
+        for wid in self.spare_qrows:
+            wid.setVisible(False)
+        self.ui.statusbar.showMessage(f'{self._now()} Queue for {item.text()} loaded!')
         logging.info(f'Queue for {item.text()} loaded!')
+        self.get_obj_data() # resolves object in background, then updates SkyView and finder chart
 
     def get_qlist(self):
         # Read CCD queue from file
-        data = {'Object': [], 'Number': [], 'Type': [], 'Filter': [], 'Exposure': [], 'ROT': []}
+        columns = QUEUE_COLUMNS
         with open(self.ccdobs, 'r') as file:
-            current_object_name = '0_CURRENT_QUEUE'
-            for line in file:
-                line = line.replace('Ha narrow', 'Han') if 'Ha narrow' in line else line
-                line = line.replace('Ha wide', 'Haw') if 'Ha wide' in line else line
-                line = line.strip()
-                if line.startswith('%'):
-                    current_object_name = line[1:].strip()
-                else:
-                    parts = line.split()
-                    if parts:
-                        data['Object'].append(current_object_name)
-                        data['Number'].append(int(parts[0]))
-                        data['Type'].append(parts[1])
-                        data['Filter'].append(parts[2])
-                        data['Exposure'].append(float(parts[3]))
-                        data['ROT'].append(str(parts[4]))
-
-        return pd.DataFrame(data)
+            text = file.read()
+        # Translate CCDOBS filter names to short ones on whole text (no per-line checks)
+        for short_name, ccdobs_name in FILTER_NAMES.items():
+            text = text.replace(ccdobs_name, short_name)
+        # First section (before any '% name' header) is the current queue, headers may be indented
+        sections = re.split(r'\n[ \t]*%', '\n' + text)
+        names, counts, rows = [], [], []
+        for n, section in enumerate(sections):
+            if n == 0:
+                name, body = '0_CURRENT_QUEUE', section
+            else:
+                name, _, body = section.partition('\n')
+                name = name.strip()
+            section_rows = [line for line in body.splitlines() if line.strip()]
+            if section_rows:
+                names.append(name)
+                counts.append(len(section_rows))
+                rows.extend(section_rows)
+        if not rows:
+            return self.categorize_queue(pd.DataFrame(columns=columns))
+        # Parse rows of all sections at once, object name per row comes from section sizes
+        qobjs = pd.read_csv(io.StringIO('\n'.join(rows)), sep=r'\s+', header=None, names=columns[1:],
+                            dtype={'Number': int, 'Type': str, 'Filter': str, 'Exposure': float, 'ROT': str},
+                            keep_default_na=False)  # keep 'None' filter as string
+        qobjs.insert(0, 'Object', np.repeat(names, counts))
+        return self.categorize_queue(qobjs)
+
+    def categorize_queue(self, queue):
+        # Store repeated string columns as categoricals (recomputes categories after concat)
+        return queue.astype({col: 'category' for col in CATEGORY_COLUMNS})
     
     
     @update_table
@@ -355,27 +505,104 @@ class QmanMain(QMainWindow):
         # Initialize table as pandas DataFrame from dictionary
         data = {'Object': [objname], 'RA': [''], 'DEC': [''], 'HA': [''], 'Alt': [''], 'Queue time': [str(qtime)]}
         self.table_data = pd.DataFrame.from_dict(data)
-        # Get object data from astropy
-        self.my_obj = ObjectInfo(objname=objname, objpos=self.objpos, debug=self.debug)
-        self.my_obj.check_objpos() # check if object is in objpos.dat
-        obj_alt, obj_az, obj_ha, ra, dec = self.my_obj.get_info()
+        # Get object data from astropy in worker thread (name resolving can take a while)
+        self._resolve_id += 1
+        self._resolving = True
+        worker = Worker(self.resolve_object, objname, self._resolve_id)
+        worker.signals.result.connect(self.apply_object_info, Qt.QueuedConnection)
+        worker.signals.error.connect(self.on_resolve_error, Qt.QueuedConnection)
+        self.thread_pool.start(worker)
+        self.busy.show()
+        self.ui.statusbar.showMessage(f'{self._now()} Resolving {objname}...')
+        return self
+
+    def resolve_object(self, objname, resolve_id):
+        # Runs in worker thread - no GUI calls here
+        try:
+            my_obj = ObjectInfo(objname=objname, objpos=self.objpos, debug=self.debug)
+            my_obj.check_objpos() # check if object is in objpos.dat
+            return resolve_id, my_obj, my_obj.get_info()
+        except Exception as e:
+            e.resolve_id = resolve_id  # lets on_resolve_error drop errors of outdated resolves
+            raise
+
+    @Slot(object)
+    @update_table
+    def apply_object_info(self, result):
+        resolve_id, my_obj, (obj_alt, obj_az, obj_ha, ra, dec) = result
+        if resolve_id != self._resolve_id:
+            return self # another object was selected in the meantime
+        self._resolving = False
+        self.busy.hide()
+        self.my_obj = my_obj
         self.ui.obj_name.setText(self.my_obj.normed_objname)
         self.table_data['RA'] = f'{ra} (J2000)' if self.my_obj.found else f'{ra} (J2000)*'
         self.table_data['DEC'] = f'{dec} (J2000)' if self.my_obj.found else f'{dec} (J2000)*'
         self.table_data['HA'] = f'{obj_ha}'
         self.table_data['Alt'] = f'{obj_alt}'
         self.skyview.create_aladin_view(self.my_obj.c.ra.deg, self.my_obj.c.dec.deg)
+        self.generate_fchart()
+        self.run_replot_skyplot(force=True)  # also requests json_dump
         # if objname != '0_CURRENT_QUEUE' and objname not in self.objpos['Object'].values:
         # elif objname != '0_CURRENT_QUEUE':
         return self
 
-    def filter_qobjs(self):
-        filt_obj = self.ui.qobjs_filter.text()
-        all_obj = self.qobjs['Object'].unique()
-        filtered = filter(lambda x: filt_obj.lower() in x.lower(), all_obj)
+    @Slot(object)
+    def on_resolve_error(self, e):
+        if e.resolve_id != self._resolve_id:
+            return  # another object was selected in the meantime
+        # _resolving stays set: table shows the new name but my_obj is still the old object,
+        # so json_dump is suppressed until a resolve succeeds
+        self.busy.hide()
+        self.ui.statusbar.showMessage(f'{self._now()} Error: {e}')
+
+    def fill_qobjs_list(self):
+        self._obj_names = sorted(self._queue_frames, key=str.lower)  # kept sorted on add/remove/rename
+        self._names_lower = [obj.lower() for obj in self._obj_names]  # parallel to self._obj_names and QListWidget rows
+        # Add all items at once without per-item signals and repaints
+        self.ui.qobjs.setUpdatesEnabled(False)
+        self.ui.qobjs.blockSignals(True)
         self.ui.qobjs.clear()
-        for obj in sorted(filtered, key=str.lower):
-            self.ui.qobjs.addItem(obj)
+        self.ui.qobjs.addItems(self._obj_names)
+        self.ui.qobjs.blockSignals(False)
+        self.ui.qobjs.setUpdatesEnabled(True)
+
+    def reload_from_disk(self):
+        # Re-read CCDOBS file (e.g. changed outside QMAN) and keep current object selected if possible
+        current = self.ui.qobjs.currentItem()
+        name = current.text() if current is not None else None
+        self.load_queues()
+        self.fill_qobjs_list()
+        self.do_filter_qobjs()
+        row = self._obj_names.index(name) if name in self._obj_names else 0
+        self.ui.qobjs.setCurrentRow(row)
+        self.on_qlist_item_clicked(self.ui.qobjs.item(row))
+        self.ui.statusbar.showMessage(f'{self._now()} Queues reloaded from {self.ccdobs}!')
+        logging.info(f'Queues reloaded from {self.ccdobs}!')
+
+    def filter_qobjs(self):
+        self.filter_timer.start(150)
+
+    def do_filter_qobjs(self):
+        filt_obj = self.ui.qobjs_filter.text().lower()
+        for row, obj in enumerate(self._names_lower):
+            self.ui.qobjs.setRowHidden(row, filt_obj not in obj)
+
+    def insert_obj_name(self, name):
+        # Insert object into sorted name lists and QListWidget, return its row
+        row = bisect.bisect_right(self._names_lower, name.lower())
+        self._obj_names.insert(row, name)
+        self._names_lower.insert(row, name.lower())
+        self.ui.qobjs.insertItem(row, name)
+        self.ui.qobjs.setRowHidden(row, self.ui.qobjs_filter.text().lower() not in name.lower())
+        return row
+
+    def remove_obj_name(self, name):
+        # Remove object from sorted name lists and QListWidget
+        row = self._obj_names.index(name)
+        del self._obj_names[row]
+        del self._names_lower[row]
+        self.ui.qobjs.takeItem(row)
 
     def main(self):
         lockfile = "/tmp/qman.lock"
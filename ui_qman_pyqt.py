@@ -46,6 +46,8 @@ class Ui_MainWindow(object):
         self.actionChange_name.setObjectName(u"actionChange_name")
         self.actionQuit = QAction(MainWindow)
         self.actionQuit.setObjectName(u"actionQuit")
+        self.actionReload_queues = QAction(MainWindow)
+        self.actionReload_queues.setObjectName(u"actionReload_queues")
         self.centralwidget = QWidget(MainWindow)
         self.centralwidget.setObjectName(u"centralwidget")
         sizePolicy1 = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
@@ -299,6 +301,7 @@ class Ui_MainWindow(object):
         self.menuMenu.addSeparator()
         self.menuMenu.addAction(self.actionSet_queue)
         self.menuMenu.addSeparator()
+        self.menuMenu.addAction(self.actionReload_queues)
 
         self.retranslateUi(MainWindow)
 
@@ -315,6 +318,10 @@ class Ui_MainWindow(object):
         self.actionSet_queue.setText(QCoreApplication.translate("MainWindow", u"Set queue", None))
         self.actionChange_name.setText(QCoreApplication.translate("MainWindow", u"Change name", None))
         self.actionQuit.setText(QCoreApplication.translate("MainWindow", u"Quit", None))
+        self.actionReload_queues.setText(QCoreApplication.translate("MainWindow", u"Reload queues", None))
+#if QT_CONFIG(shortcut)
+        self.actionReload_queues.setShortcut(QCoreApplication.translate("MainWindow", u"F5", None))
+#endif // QT_CONFIG(shortcut)
         self.resolve.setText(QCoreApplication.translate("MainWindow", u"Resolve", None))
         self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_aladin), QCoreApplication.translate("MainWindow", u"Aladin", None))
         self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_fchart), QCoreApplication.translate("MainWindow", u"Finder chart", None))
@@ -1,5 +1,5 @@
 from PySide6.QtWidgets import QDoubleSpinBox, QComboBox, QSpinBox, QHBoxLayout, QWidget, QPushButton, QHeaderView, QSizePolicy, QWidget, QVBoxLayout, QSizePolicy
-from PySide6.QtCore import Qt, QRunnable, Slot, QThreadPool
+from PySide6.QtCore import Qt, QRunnable, Slot, QThreadPool, Signal
 from PySide6 import QtCore, QtGui
 from dataclasses import dataclass
 import logging
@@ -107,7 +107,7 @@ class SkyPlot(QWidget):
         [self.ax.fill_between(fill_theta, 90+i, 90+i+6, color=c, alpha=0.5) for i, c in zip([0, 6, 12], ['lightgrey', 'darkgrey', 'black'])]
         self.ax.fill_between(fill_theta, 55, 90, color='xkcd:bright red', alpha=0.1)
         self.ax.fill_between(fill_theta, 0, 55, color='xkcd:apple green', alpha=0.1)
-        self.canvas.draw()  # Refresh canvas
+        self.canvas.draw_idle()  # Refresh canvas (coalesced into next Qt paint)
 
     def replot(self):
         # self.figure.clear()
@@ -127,10 +127,13 @@ class SkyPlot(QWidget):
                 self.replot()
 
 class FinderChart(QWidget):
+    rendered = Signal()  # emitted from worker thread when Agg buffer is ready
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.figure = Figure(figsize=(3.5, 3.5))
         self.canvas = FigureCanvas(self.figure)
+        self.rendered.connect(self.canvas.update)  # repaint in GUI thread
         self.ax = self.figure.add_subplot(111)
         self.figure.tight_layout()
 
@@ -174,7 +177,12 @@ class FinderChart(QWidget):
             self.ax.spines['bottom'].set_visible(False)
             self.ax.spines['left'].set_visible(False)
 
-            self.canvas.draw() 
+            # plot() runs in worker thread: render into Agg buffer only (canvas.draw() would touch Qt widgets),
+            # repaint is queued to GUI thread
+            renderer = self.canvas.get_renderer()
+            renderer.clear()
+            self.figure.draw(renderer)
+            self.rendered.emit()
 
 
 @dataclass
@@ -356,6 +364,19 @@ class qrow_widget(QWidget):
         layout.addWidget(self.delrow)
         self.setLayout(layout)
 
+    def update_from(self, qrow):
+        # Reuse widget for another queue row; signals blocked so queue time is not recounted per field
+        fields = (self.nexp, self.imptyp, self.filter, self.exptime, self.rot)
+        for field in fields:
+            field.blockSignals(True)
+        self.nexp.setValue(qrow['Number'])
+        self.exptime.setValue(qrow['Exposure'])
+        # setCurrentText ignores unknown values; fall back to first item like a new widget does
+        for combo, value in ((self.imptyp, qrow['Type']), (self.filter, qrow['Filter']), (self.rot, qrow['ROT'])):
+            combo.setCurrentIndex(max(combo.findText(value), 0))
+        for field in fields:
+            field.blockSignals(False)
+
     @update_table
     def on_value_changed(self):
         qtime = CurrentQueue(self.obj.qrows, 'dummy').countQueue()